@@ -3,6 +3,10 @@ Generation Two: Self-Optimization and Genetic Evolution
 Modular implementation with organized tool structure
 """
 
+# Single source of truth for the package version; the build manifests read
+# it from here so runtime code never needs a pkg_resources lookup
+__version__ = "1.0.0"
+
 # Core components
 from .core import (
     TemplateGenerator,
@@ -48,7 +48,8 @@ except Exception as e:
     logger.error(f"  ❌ Failed to import CyberpunkGUI: {e}", exc_info=True)
     sys.exit(1)
 
-if __name__ == "__main__":
+def main():
+    """Entry point for the installed generation-two launcher"""
     logger.info("=" * 60)
     logger.info("Starting GUI initialization...")
     
@@ -106,3 +107,6 @@ if __name__ == "__main__":
     else:
         logger.error("❌ Authentication failed. Application cannot start without valid credentials.")
         sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -2,47 +2,140 @@
 Setup script for Generation Two
 """
 
-from setuptools import setup, find_packages
+import json
+import os
+import re
+import sys
+
+from setuptools import setup, find_namespace_packages
 from pathlib import Path
 
-# Get the directory where setup.py is located
-setup_dir = Path(__file__).parent
-# Get project root (parent of generation_two) - this is where the package actually is
+# Get the directory where setup.py is located (resolved once; every later
+# path derives from this without further filesystem calls)
+setup_dir = Path(__file__).resolve().parent
+# Get project root (parent of generation_two) - this is where the package actually is.
+# setup.py deliberately stays inside generation_two/: build.py's sdist step
+# and the release workflow both invoke it here, and the scoped
+# include/exclude filters below already keep the reparented discovery walk
+# to this one package subtree, so relocating to the repo root (or a src/
+# layout) would churn every caller for no additional walk savings.
 project_root = setup_dir.parent
+# Stringify once; both package_dir and find_packages take the same string
+PROJECT_ROOT_STR = str(project_root)
+
+# Pull the version out of the package __init__ with a regex rather than
+# importing it, so building doesn't drag in the GUI's dependency tree
+VERSION = re.search(
+    r'^__version__ = "([^"]+)"',
+    (setup_dir / "__init__.py").read_text(encoding="utf-8"),
+    re.MULTILINE,
+).group(1)
+
+# The README only matters on a package index page, so it is embedded in
+# METADATA just for PyPI-bound release builds (BUILD_FOR_PYPI=1) of the
+# distribution-producing commands; every other build ships a lean wheel
+# and skips the file I/O entirely
+long_description = ""
+if os.environ.get("BUILD_FOR_PYPI") and any(
+        cmd in sys.argv for cmd in ("sdist", "bdist_wheel", "upload")):
+    # Open directly rather than stat-then-open: one syscall, no race
+    try:
+        long_description = (setup_dir / "README.md").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        pass
 
-# Read README
-readme_file = setup_dir / "README.md"
-long_description = readme_file.read_text(encoding="utf-8") if readme_file.exists() else ""
+def _find_packages_cached():
+    """Discover packages once and reuse the list across backend calls
+
+    A single pip install invokes the build backend several times (metadata
+    preparation, then the wheel build), and each invocation re-walks the
+    package tree. The discovered list is cached under build/ keyed on the
+    mtimes of the package directories, so repeat invocations skip the walk.
+    """
+    pkg_root = project_root / "generation_two"
+    # Packages nest arbitrarily deep, so every directory's mtime goes into
+    # the fingerprint (a dir's mtime changes when entries are added or
+    # removed); dirs that never hold packages are pruned so build output
+    # churn neither slows the walk nor invalidates the cache
+    fingerprint = {}
+    for dirpath, dirnames, _ in os.walk(pkg_root):
+        dirnames[:] = [
+            d for d in dirnames
+            if d not in ("__pycache__", "build", "dist", "node_modules")
+            and not d.startswith(".")
+        ]
+        fingerprint[dirpath] = os.stat(dirpath).st_mtime_ns
+    cache_file = setup_dir / "build" / ".package_list.json"
+    try:
+        cached = json.loads(cache_file.read_text())
+        if cached["fingerprint"] == fingerprint:
+            return cached["packages"]
+    except (OSError, ValueError, KeyError):
+        pass
+    # find_namespace_packages prunes directories outside the include
+    # globs at walk time and drops the per-level __init__.py requirement
+    packages = find_namespace_packages(
+        where=PROJECT_ROOT_STR,
+        include=["generation_two", "generation_two.*"],
+        exclude=[
+            # Discovered names are all generation_two.-prefixed, so the
+            # patterns must be too (unprefixed globs never match anything)
+            "generation_two.node_modules*",
+            "generation_two.build*",
+            "generation_two.dist*",
+            "generation_two.tests*",
+            "generation_two.venv*",
+            "*.egg-info*",
+            # Data/script dirs that namespace discovery would otherwise
+            # promote to packages
+            "generation_two.bin",
+            "generation_two.constants",
+            "generation_two.spec",
+        ],
+    )
+    try:
+        cache_file.parent.mkdir(exist_ok=True, parents=True)
+        cache_file.write_text(json.dumps(
+            {"fingerprint": fingerprint, "packages": packages}))
+    except OSError:
+        pass
+    return packages
 
 setup(
     name="generation-two",
-    version="1.0.0",
+    version=VERSION,
     description="WorldQuant Brain Alpha Mining System - Generation Two",
     long_description=long_description,
     long_description_content_type="text/markdown",
     author="WorldQuant Miner",
-    author_email="your-email@example.com",
     url="https://github.com/yourusername/worldquant-miner",
     # Specify package_dir so packages are found relative to project root
-    package_dir={'': str(project_root)},
-    packages=find_packages(where=str(project_root)),  # Find packages in project root
-    include_package_data=True,
+    # Must stay relative: distutils' data-file handling rejects absolute
+    # package roots ("setup script specifies an absolute path"). Relative
+    # to the *invocation* cwd, so commands that stage files (sdist) must
+    # run from the project root, where this collapses to '.' and staged
+    # paths stay inside the staging directory instead of escaping via '..'
+    package_dir={'': os.path.relpath(PROJECT_ROOT_STR)},
+    # Scope discovery to this package so setuptools prunes sibling
+    # generations and non-Python trees at the top of the walk
+    packages=_find_packages_cached(),
+    # Only the operator constants ship as data; an explicit manifest avoids
+    # the MANIFEST/VCS file walk include_package_data triggers
+    package_data={"generation_two": ["constants/*.json"]},
     install_requires=[
-        "requests>=2.28.0",
+        "requests>=2.28,<3",
     ],
     python_requires=">=3.8",
-    entry_points={
-        "console_scripts": [
-            "generation-two=generation_two.gui.run_gui:main",
-        ],
-    },
+    # A plain script instead of a console_scripts entry point: the
+    # setuptools-generated wrapper imports pkg_resources on every launch,
+    # which is user-visible latency for an interactive GUI
+    scripts=["bin/generation-two"],
+    # python_requires already states the supported interpreters, so the
+    # per-minor-version classifiers only bloated METADATA
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Financial and Insurance Industry",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3 :: Only",
     ],
 )